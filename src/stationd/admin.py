@@ -0,0 +1,204 @@
+'''Admin is a pseudo-device for inspecting the running daemon.
+
+It can profile command handling with cProfile, capture tracemalloc snapshots
+and diffs, and report live thread counts. Reports are written to files given in
+the [ADMIN] config section. Only the addresses listed in that section (by
+default localhost) may issue admin commands.
+'''
+
+import cProfile
+import logging
+import pstats
+import queue
+import threading
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import TypeVar
+
+from . import stationd as sd
+
+# Module logger
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+DEFAULT_ALLOWED_ADDRESSES = '127.0.0.1 ::1'
+DEFAULT_PROFILE_PATH = 'stationd-profile.txt'
+DEFAULT_MEMORY_PATH = 'stationd-memory.txt'
+PROFILE_SORT = 'cumulative'
+MEMORY_TOP = 25  # Number of entries written per memory report
+HANDLER_THREAD_NAME = 'command-handler'
+
+# The <component>_<action> methods reachable through the command parser
+ACTIONS = frozenset(
+    {
+        'profile_start',
+        'profile_stop',
+        'memory_start',
+        'memory_stop',
+        'memory_snapshot',
+        'memory_diff',
+    }
+)
+
+
+class AdminAccessError(Exception):
+    """Exception raised when an admin command comes from a disallowed address."""
+
+
+class AdminStateError(Exception):
+    """Exception raised when an admin command needs state that isn't set up.
+
+    For example taking a memory snapshot while tracemalloc is not tracing.
+    """
+
+    def __init__(self, reason: str) -> None:
+        """Initialize Admin State exception."""
+        self.reason = reason
+
+
+class Admin:
+    """Runtime introspection controls for the station daemon.
+
+    Follows the same <device> <component> <action> command layout as the
+    hardware devices so it can be driven through the regular command parser.
+
+    Admin commands run while StationD holds its socket lock, so other commands
+    wait on them. Taking a memory snapshot can still take a while on a Pi, but
+    building and writing reports is queued and done by write_reports() after
+    the lock is released.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the admin pseudo-device from the optional [ADMIN] config section."""
+        self.allowed_addresses = set(
+            sd.config.get('ADMIN', 'allowed_addresses', fallback=DEFAULT_ALLOWED_ADDRESSES).split()
+        )
+        self.profile_path = Path(
+            sd.config.get('ADMIN', 'profile_path', fallback=DEFAULT_PROFILE_PATH)
+        )
+        self.memory_path = Path(sd.config.get('ADMIN', 'memory_path', fallback=DEFAULT_MEMORY_PATH))
+        self._profile: cProfile.Profile | None = None
+        self._snapshot: tracemalloc.Snapshot | None = None
+        self._reports: queue.SimpleQueue[Callable[[], None]] = queue.SimpleQueue()
+        self._reports_lock = threading.Lock()
+
+    def authorize(self, command: list[str], client_address: tuple[str, int]) -> None:
+        """Reject commands from disallowed addresses or naming anything but an admin action.
+
+        The command parser looks methods up by name, so without this any method
+        could be reached with a crafted command.
+        """
+        if client_address[0] not in self.allowed_addresses:
+            raise AdminAccessError
+        if len(command) != 3 or command[2] == 'status':
+            return
+        if f'{command[1].replace("-", "_")}_{command[2]}' not in ACTIONS:
+            raise sd.InvalidCommandError
+
+    def profiled(self, fxn: Callable[..., T], *args: object) -> T:
+        """Call fxn, recording it in the profiling session if one is active.
+
+        Callers must serialize calls (StationD holds its socket lock) since only
+        one profiler may be enabled at a time.
+        """
+        profile = self._profile
+        if profile is None:
+            return fxn(*args)
+        return profile.runcall(fxn, *args)
+
+    def device_status(self, command: list[str]) -> str:
+        return ''.join(
+            self.component_status([command[0], component, *command[1:]])
+            for component in ('profile', 'memory', 'threads')
+        )
+
+    def component_status(self, command: list[str]) -> str:
+        component_name = command[1]
+
+        if component_name == 'profile':
+            state = 'ON' if self._profile is not None else 'OFF'
+        elif component_name == 'memory':
+            state = 'ON' if tracemalloc.is_tracing() else 'OFF'
+        elif component_name == 'threads':
+            threads = threading.enumerate()
+            handlers = sum(t.name.startswith(HANDLER_THREAD_NAME) for t in threads)
+            state = f'{len(threads)} total, {handlers} handlers'
+        else:
+            raise sd.InvalidCommandError
+
+        return f'{command[0]} {command[1]} {state}\n'
+
+    def profile_start(self) -> None:
+        """Start a cProfile session around command handling."""
+        if self._profile is not None:
+            raise sd.NoChangeError
+        self._profile = cProfile.Profile()
+
+    def profile_stop(self) -> None:
+        """Stop the cProfile session and write sorted stats to the profile path."""
+        if self._profile is None:
+            raise sd.NoChangeError
+        profile, self._profile = self._profile, None
+        profile.disable()
+        self._reports.put(lambda: self._write_profile_report(profile))
+
+    def memory_start(self) -> None:
+        """Start tracing memory allocations."""
+        if tracemalloc.is_tracing():
+            raise sd.NoChangeError
+        tracemalloc.start()
+
+    def memory_stop(self) -> None:
+        """Stop tracing memory allocations and drop the stored snapshot."""
+        if not tracemalloc.is_tracing():
+            raise sd.NoChangeError
+        tracemalloc.stop()
+        self._snapshot = None
+
+    def memory_snapshot(self) -> None:
+        """Take a snapshot and write its top allocations to the memory path."""
+        if not tracemalloc.is_tracing():
+            raise AdminStateError('not tracing')
+        snapshot = tracemalloc.take_snapshot()
+        self._snapshot = snapshot
+        self._reports.put(lambda: self._write_memory_report(snapshot.statistics('lineno')))
+
+    def memory_diff(self) -> None:
+        """Take a snapshot and write its difference from the previous one to the memory path."""
+        if not tracemalloc.is_tracing():
+            raise AdminStateError('not tracing')
+        if self._snapshot is None:
+            raise AdminStateError('no snapshot')
+        snapshot, previous = tracemalloc.take_snapshot(), self._snapshot
+        self._snapshot = snapshot
+        self._reports.put(
+            lambda: self._write_memory_report(snapshot.compare_to(previous, 'lineno'))
+        )
+
+    def write_reports(self) -> None:
+        """Build and write the reports queued by profile and memory commands.
+
+        Called by StationD outside its socket lock so other commands aren't held up.
+        """
+        with self._reports_lock:
+            while True:
+                try:
+                    report = self._reports.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    report()
+                except OSError:
+                    logger.exception('Failed to write admin report')
+
+    def _write_profile_report(self, profile: cProfile.Profile) -> None:
+        with self.profile_path.open('w', encoding='utf-8') as f:
+            pstats.Stats(profile, stream=f).sort_stats(PROFILE_SORT).print_stats()
+
+    def _write_memory_report(
+        self, stats: list[tracemalloc.Statistic] | list[tracemalloc.StatisticDiff]
+    ) -> None:
+        with self.memory_path.open('w', encoding='utf-8') as f:
+            f.writelines(f'{stat}\n' for stat in stats[:MEMORY_TOP])
@@ -0,0 +1,283 @@
+'''Audit is a structured, append-only journal of every handled command.
+
+Each record is a JSON line holding the timestamp, client, parsed command,
+outcome (OK or the exception raised), response and duration. Records are
+written to segments named after the time of their first record, and each
+segment has a sparse index of (timestamp, byte offset) pairs so a query can
+skip straight to the requested time range instead of scanning the whole
+history.
+
+Timestamps never decrease within a segment: if the wall clock steps backward
+(e.g. an NTP sync on a Pi without an RTC) a new segment is started. Queries
+merge the segments so records always come back in timestamp order. Lines torn
+by a crash or power loss mid-write are skipped with a warning.
+
+A catalog in the audit directory records the last timestamp of each segment
+once it is rotated out, so queries skip older segments without opening them.
+Segments missing from the catalog (the live one, or one left by a crash) are
+always read.
+
+Query the journal with:
+
+    python -m stationd.audit --since 2025-01-01T02:00 --until 2025-01-01T03:00 --device vhf
+'''
+
+import argparse
+import bisect
+import heapq
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+DEFAULT_AUDIT_PATH = Path('./audit')
+SEGMENT_SIZE = 4 * 1024 * 1024  # In bytes, a new segment is started past this size
+INDEX_INTERVAL = 64  # Records between index entries
+SEGMENT_SUFFIX = '.jsonl'
+INDEX_SUFFIX = '.idx'
+CATALOG_NAME = 'catalog.idx'
+OK = 'OK'
+
+# Module logger
+logger = logging.getLogger(__name__)
+
+
+class AuditLog:
+    """Writer and reader for a directory of audit segments.
+
+    Writes are serialized with a lock so records from concurrent handler
+    threads are never interleaved.
+    """
+
+    def __init__(
+        self, directory: Path = DEFAULT_AUDIT_PATH, segment_size: int = SEGMENT_SIZE
+    ) -> None:
+        """Initialize an audit log rooted at directory, which is created on first write."""
+        self.directory = directory
+        self.segment_size = segment_size
+        self._lock = threading.Lock()
+        self._segment: Path | None = None
+        self._count = 0
+        self._last_ts = float('-inf')
+
+    def call(
+        self,
+        fxn: Callable[[list[str], tuple[str, int]], str],
+        command: list[str],
+        client_address: tuple[str, int],
+    ) -> str:
+        """Call a command dispatcher and record the command, outcome and duration."""
+        timestamp = time.time()
+        start = time.monotonic()
+        outcome = OK
+        response = None
+        try:
+            response = fxn(command, client_address)
+        except Exception as e:
+            outcome = type(e).__name__
+            raise
+        finally:
+            record = {
+                'ts': timestamp,
+                'client': f'{client_address[0]}:{client_address[1]}',
+                'command': command,
+                'outcome': outcome,
+                'response': response,
+                'duration': time.monotonic() - start,
+            }
+            # A failing journal must not stop the command from being answered
+            try:
+                self.write(record)
+            except OSError:
+                logger.exception('Failed to write audit record')
+        return response
+
+    def write(self, record: dict[str, Any]) -> None:
+        """Append a record to the current segment, rotating and indexing as needed."""
+        line = (json.dumps(record) + '\n').encode('utf-8')
+        with self._lock:
+            segment = self._segment
+            if segment is None or self._rotate_due(segment, record['ts']):
+                segment = self._new_segment(record['ts'])
+            offset = _append(segment, line)
+            # Only switch segments once the first record has landed, so a failed
+            # append leaves the writer free to try a new segment next time
+            if segment != self._segment:
+                previous, self._segment, self._count = self._segment, segment, 0
+                if previous is not None:
+                    self._catalog(previous, self._last_ts)
+                self._catalog(segment, float('inf'))
+            count = self._count
+            self._count += 1
+            self._last_ts = record['ts']
+            if count % INDEX_INTERVAL == 0:
+                index = f'{record["ts"]!r} {offset}\n'.encode()
+                _append(segment.with_suffix(INDEX_SUFFIX), index)
+
+    def _rotate_due(self, segment: Path, ts: float) -> bool:
+        if ts < self._last_ts:
+            return True
+        try:
+            return segment.stat().st_size >= self.segment_size
+        except FileNotFoundError:
+            # Deleted or archived from under us
+            return True
+
+    def _catalog(self, segment: Path, last_ts: float) -> None:
+        # Later entries for the same segment replace earlier ones, inf marks it as open
+        _append(self.directory / CATALOG_NAME, f'{segment.name} {last_ts!r}\n'.encode())
+
+    def _new_segment(self, ts: float) -> Path:
+        # Never reuse an existing segment, its records may be newer than ts
+        self.directory.mkdir(parents=True, exist_ok=True)
+        name = f'{int(ts):012d}'
+        path = self.directory / f'{name}{SEGMENT_SUFFIX}'
+        seq = 0
+        while path.exists():
+            seq += 1
+            path = self.directory / f'{name}-{seq}{SEGMENT_SUFFIX}'
+        return path
+
+    def segments(self) -> list[tuple[float, Path]]:
+        """List (start time, path) of every segment, oldest first."""
+        segments = []
+        for path in self.directory.glob(f'*{SEGMENT_SUFFIX}'):
+            start, _, seq = path.stem.partition('-')
+            if start.isdigit() and (not seq or seq.isdigit()):
+                segments.append((float(start), int(seq or 0), path))
+        return [(start, path) for start, _, path in sorted(segments)]
+
+    def query(self, since: float = 0.0, until: float = float('inf')) -> Iterator[dict[str, Any]]:
+        """Yield records with since <= ts <= until in timestamp order.
+
+        Segments starting after until or ending before since are not opened,
+        and the index of every other segment is used to seek close to since
+        before reading.
+        """
+        ends = self._segment_ends()
+        readers = []
+        for start, path in self.segments():
+            if start > until:
+                break
+            if ends.get(path.name, float('inf')) < since:
+                continue
+            readers.append(_read_segment(path, since, until))
+        return heapq.merge(*readers, key=lambda record: record['ts'])
+
+    def _segment_ends(self) -> dict[str, float]:
+        catalog = self.directory / CATALOG_NAME
+        ends: dict[str, float] = {}
+        if not catalog.exists():
+            return ends
+        for entry in catalog.read_text(encoding='utf-8').splitlines():
+            try:
+                name, last_ts = entry.split()
+                ends[name] = float(last_ts)
+            except ValueError:
+                logger.warning('Skipping corrupt catalog entry in %s: %r', catalog, entry)
+        return ends
+
+
+def _append(path: Path, data: bytes) -> int:
+    """Append data on a fresh line of path and return the offset it was written at."""
+    with path.open('a+b') as f:
+        offset = f.seek(0, os.SEEK_END)
+        if offset > 0:
+            f.seek(-1, os.SEEK_END)
+            # Finish a line torn by an interrupted write so data starts cleanly
+            if f.read(1) != b'\n':
+                f.write(b'\n')
+                offset += 1
+        f.write(data)
+    return offset
+
+
+def _read_segment(path: Path, since: float, until: float) -> Iterator[dict[str, Any]]:
+    offset = 0
+    index_path = path.with_suffix(INDEX_SUFFIX)
+    if index_path.exists():
+        entries = []
+        for entry in index_path.read_text(encoding='utf-8').splitlines():
+            try:
+                ts, entry_offset = entry.split()
+                entries.append((float(ts), int(entry_offset)))
+            except ValueError:
+                logger.warning('Skipping corrupt index entry in %s: %r', index_path, entry)
+        times = [ts for ts, _ in entries]
+        # Last indexed record strictly before since, earlier records can be skipped
+        i = bisect.bisect_left(times, since) - 1
+        if i >= 0:
+            offset = entries[i][1]
+
+    with path.open('rb') as f:
+        f.seek(offset)
+        for line in f:
+            try:
+                record = json.loads(line)
+                record['ts'] = float(record['ts'])
+            except (ValueError, TypeError, KeyError):
+                logger.warning('Skipping corrupt record in %s: %r', path, line)
+                continue
+            if record['ts'] < since:
+                continue
+            if record['ts'] > until:
+                return
+            yield record
+
+
+def _parse_time(value: str) -> float:
+    return datetime.fromisoformat(value).timestamp()
+
+
+def _format(record: dict[str, Any]) -> str:
+    local = datetime.fromtimestamp(record['ts'], tz=UTC).astimezone()
+    timestamp = local.isoformat(sep=' ', timespec='milliseconds')
+    return '\t'.join(
+        [
+            timestamp,
+            record['client'],
+            ' '.join(record['command']),
+            record['outcome'],
+            f'{record["duration"] * 1000:.1f}ms',
+        ]
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Parse CLI args and print matching audit records."""
+    parser = argparse.ArgumentParser(description='Query the station daemon audit log.')
+    parser.add_argument(
+        '--dir',
+        default=DEFAULT_AUDIT_PATH,
+        type=Path,
+        help='Path to the audit log directory',
+    )
+    parser.add_argument('--since', type=_parse_time, default=0.0, help='ISO 8601 start time')
+    parser.add_argument('--until', type=_parse_time, default=float('inf'), help='ISO 8601 end time')
+    parser.add_argument('--device', help='Only show commands for this device, e.g. vhf')
+    parser.add_argument('--outcome', help='Only show this outcome, e.g. OK or PTTConflictError')
+    parser.add_argument('--client', help='Only show commands from this client address')
+    parser.add_argument('--json', action='store_true', help='Print records as JSON lines')
+    args = parser.parse_args(argv)
+    if not args.dir.is_dir():
+        parser.error(f'audit directory not found: {args.dir}')
+    logging.basicConfig(format='%(levelname)s: %(message)s')
+
+    for record in AuditLog(args.dir).query(args.since, args.until):
+        device = record['command'][0].replace('_', '-') if record['command'] else ''
+        if args.device is not None and device != args.device.replace('_', '-'):
+            continue
+        if args.outcome is not None and record['outcome'].lower() != args.outcome.lower():
+            continue
+        if args.client is not None and record['client'].rsplit(':', 1)[0] != args.client:
+            continue
+        print(json.dumps(record) if args.json else _format(record))  # noqa: T201
+
+
+if __name__ == '__main__':
+    main()
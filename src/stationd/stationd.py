@@ -15,7 +15,9 @@ from pathlib import Path
 import gpiod
 
 from . import accessory as acc
+from . import admin as adm
 from . import amplifier as amp
+from . import audit
 
 # Module logger
 logger = logging.getLogger(__name__)
@@ -144,6 +146,12 @@ class StationD:
         self.radio_host = acc.Accessory("RADIO-HOST")
         self.rotator = acc.Accessory("ROTATOR")
         self.sdr_b200 = acc.Accessory("SDR-B200")
+        # Runtime introspection
+        self.admin = adm.Admin()
+        # Command journal
+        self.audit = audit.AuditLog(
+            Path(config.get('AUDIT', 'path', fallback=str(audit.DEFAULT_AUDIT_PATH)))
+        )
         # Temperature sensor
         self.pi_cpu = TEMP_PATH
         # Logger
@@ -160,29 +168,36 @@ class StationD:
         logger.info('Closing connection...')
         self.sock.close()
 
+    def _dispatch(self, command: list[str], client_address: tuple[str, int]) -> str:
+        device = command[0].replace('-', '_')
+
+        if device in [
+            'vhf',
+            'uhf',
+            'l_band',
+            'vu_tx_relay',
+            'satnogs_host',
+            'radio_host',
+            'rotator',
+            'sdr_b200',
+        ]:
+            return command_parser(getattr(self, device), command)
+        if device == 'admin':
+            self.admin.authorize(command, client_address)
+            return command_parser(self.admin, command)
+        if len(command) == 1 and command[0] == 'gettemp':
+            return read_temp(self.pi_cpu)
+        raise InvalidCommandError
+
     def command_handler(
         self, command: list[str], sock: socket.socket, client_address: tuple[str, int]
     ) -> None:
         """Handle incoming commands and route them to appropriate devices."""
         with self.socket_lock:
             try:
-                device = command[0].replace('-', '_')
-
-                if device in [
-                    'vhf',
-                    'uhf',
-                    'l_band',
-                    'vu_tx_relay',
-                    'satnogs_host',
-                    'radio_host',
-                    'rotator',
-                    'sdr_b200',
-                ]:
-                    message = command_parser(getattr(self, device), command)
-                elif len(command) == 1 and command[0] == 'gettemp':
-                    message = read_temp(self.pi_cpu)
-                else:
-                    message = 'FAIL: Invalid Command\n'
+                message = self.admin.profiled(
+                    self.audit.call, self._dispatch, command, client_address
+                )
             except PTTConflictError:
                 message = f'FAIL: {" ".join(command)} PTT Conflict\n'
             except amp.PTTCooldownError as e:
@@ -195,10 +210,16 @@ class StationD:
                 message = 'FAIL: Invalid Command\n'
             except NoChangeError:
                 message = f'WARNING: {" ".join(command)} No Change\n'
+            except adm.AdminAccessError:
+                message = 'FAIL: Unauthorized\n'
+            except adm.AdminStateError as e:
+                message = f'FAIL: {" ".join(command[:2])} {e.reason}\n'
 
             sock.sendto(message.encode('utf-8'), client_address)
             logger.debug('ADDRESS: %s, %s', client_address, message.strip().replace('\n', ', '))
 
+        self.admin.write_reports()
+
     def command_listener(self) -> None:
         """Listen for incoming UDP commands and spawn handler threads."""
         try:
@@ -207,7 +228,9 @@ class StationD:
                     data, client_address = self.sock.recvfrom(1024)
                     command_data = data.decode().strip('\n').strip('\r').split()
                     c_thread = threading.Thread(
-                        target=self.command_handler, args=(command_data, self.sock, client_address)
+                        target=self.command_handler,
+                        args=(command_data, self.sock, client_address),
+                        name=adm.HANDLER_THREAD_NAME,
                     )
                     c_thread.daemon = True
                     c_thread.start()
@@ -220,7 +243,9 @@ class StationD:
 # Globals ----------------------------------------------------------------------
 
 
-def command_parser(device: 'acc.Accessory | amp.TxAmplifier', command: list[str]) -> str:
+def command_parser(
+    device: 'acc.Accessory | adm.Admin | amp.TxAmplifier', command: list[str]
+) -> str:
     """Parse and execute commands for hardware devices."""
     if len(command) == 3:
         # Component Status command
@@ -0,0 +1,19 @@
+"""Shared pytest fixtures."""
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from stationd import admin, audit, stationd
+
+
+@pytest.fixture
+def daemon(tmp_path: Path) -> stationd.StationD:
+    """Build a StationD with just enough state to run command_handler."""
+    # Skip __init__, it needs the UDP socket and GPIO lines
+    sd = stationd.StationD.__new__(stationd.StationD)
+    sd.socket_lock = threading.Lock()
+    sd.admin = admin.Admin()
+    sd.audit = audit.AuditLog(tmp_path / 'audit')
+    return sd
@@ -0,0 +1,106 @@
+import threading
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from stationd import admin, stationd
+
+
+def reply(daemon: stationd.StationD, command: str) -> str:
+    sock = Mock()
+    daemon.command_handler(command.split(), sock, ('127.0.0.1', 5000))
+    return sock.sendto.call_args.args[0].decode('utf-8')
+
+
+class TestAdmin:
+    """Test the admin introspection pseudo-device."""
+
+    def test_authorize_defaults_to_localhost(self) -> None:
+        """Test that only localhost may issue admin commands by default."""
+        a = admin.Admin()
+        a.authorize(['admin', 'profile', 'start'], ('127.0.0.1', 5005))
+        with pytest.raises(admin.AdminAccessError):
+            a.authorize(['admin', 'profile', 'start'], ('10.0.0.2', 5005))
+
+    def test_authorize_rejects_helper_methods(self) -> None:
+        """Test that only admin actions can be reached through the command parser."""
+        a = admin.Admin()
+        for command in ('admin profile status', 'admin status', 'admin memory snapshot'):
+            a.authorize(command.split(), ('127.0.0.1', 5005))
+        for command in ('admin check access', 'admin -write-memory report', 'admin - init__'):
+            with pytest.raises(stationd.InvalidCommandError):
+                a.authorize(command.split(), ('127.0.0.1', 5005))
+
+    def test_command_handler_replies_to_helper_methods(self, daemon: stationd.StationD) -> None:
+        """Test that a command naming a helper method still gets a reply."""
+        assert reply(daemon, 'admin check access') == 'FAIL: Invalid Command\n'
+
+    def test_profile_writes_sorted_stats(self, tmp_path: Path) -> None:
+        """Test that a profiling session records calls and dumps stats on stop."""
+        a = admin.Admin()
+        a.profile_path = tmp_path / 'profile.txt'
+        a.profile_start()
+        with pytest.raises(stationd.NoChangeError):
+            a.profile_start()
+        assert a.profiled(sorted, [3, 1, 2]) == [1, 2, 3]
+        a.profile_stop()
+        assert not a.profile_path.exists()
+        a.write_reports()
+        assert 'sorted' in a.profile_path.read_text()
+        assert a.component_status(['admin', 'profile', 'status']) == 'admin profile OFF\n'
+
+    def test_memory_snapshot_and_diff(self, tmp_path: Path) -> None:
+        """Test that memory snapshots and diffs are written to the memory path."""
+        a = admin.Admin()
+        a.memory_path = tmp_path / 'memory.txt'
+        with pytest.raises(admin.AdminStateError):
+            a.memory_diff()
+        a.memory_start()
+        try:
+            with pytest.raises(admin.AdminStateError):
+                a.memory_diff()
+            a.memory_snapshot()
+            data = [bytearray(1024) for _ in range(100)]
+            a.memory_diff()
+            a.write_reports()
+            assert data
+            assert a.memory_path.read_text()
+        finally:
+            a.memory_stop()
+
+    def test_command_handler_reports_memory_state(self, daemon: stationd.StationD) -> None:
+        """Test that memory commands needing tracing say so instead of Invalid Command."""
+        assert reply(daemon, 'admin memory snapshot') == 'FAIL: admin memory not tracing\n'
+
+    def test_threads_status(self) -> None:
+        """Test that live command handler threads are counted."""
+        a = admin.Admin()
+        assert a.component_status(['admin', 'threads', 'status']).endswith(' 0 handlers\n')
+
+        done = threading.Event()
+        handler = threading.Thread(target=done.wait, name=admin.HANDLER_THREAD_NAME)
+        handler.start()
+        try:
+            status = a.component_status(['admin', 'threads', 'status'])
+        finally:
+            done.set()
+            handler.join()
+        assert status == f'admin threads {threading.active_count() + 1} total, 1 handlers\n'
+
+    def test_command_handler_writes_reports_after_reply(
+        self, tmp_path: Path, daemon: stationd.StationD
+    ) -> None:
+        """Test that admin reports are written by command_handler once the lock is released."""
+        daemon.admin.profile_path = tmp_path / 'profile.txt'
+        assert reply(daemon, 'admin profile start') == 'SUCCESS: admin profile start\n'
+
+        # The reply is sent with the socket lock held, the report must come after
+        written_at_reply = []
+        sock = Mock()
+        sock.sendto.side_effect = lambda *_: written_at_reply.append(
+            daemon.admin.profile_path.exists()
+        )
+        daemon.command_handler(['admin', 'profile', 'stop'], sock, ('127.0.0.1', 5000))
+        assert written_at_reply == [False]
+        assert 'function calls' in daemon.admin.profile_path.read_text()
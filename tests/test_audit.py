@@ -0,0 +1,187 @@
+import json
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+
+from stationd import audit, stationd
+
+
+def make_record(ts: float, command: str, outcome: str = audit.OK) -> dict[str, object]:
+    return {
+        'ts': ts,
+        'client': '127.0.0.1:5000',
+        'command': command.split(),
+        'outcome': outcome,
+        'response': None,
+        'duration': 0.001,
+    }
+
+
+class TestAuditLog:
+    """Test the audit journal writer and time range queries."""
+
+    def test_call_records_outcome(self, tmp_path: Path) -> None:
+        """Test that successful and failed commands are both recorded."""
+        log = audit.AuditLog(tmp_path)
+
+        def dispatch(command: list[str], _client_address: tuple[str, int]) -> str:
+            if command[0] == 'bad':
+                raise stationd.InvalidCommandError
+            return 'SUCCESS\n'
+
+        assert log.call(dispatch, ['vhf', 'status'], ('127.0.0.1', 5000)) == 'SUCCESS\n'
+        with pytest.raises(stationd.InvalidCommandError):
+            log.call(dispatch, ['bad'], ('127.0.0.1', 5000))
+
+        records = list(log.query())
+        assert [r['outcome'] for r in records] == ['OK', 'InvalidCommandError']
+        assert records[0]['client'] == '127.0.0.1:5000'
+        assert records[0]['response'] == 'SUCCESS\n'
+
+    def test_query_time_range_across_segments(self, tmp_path: Path) -> None:
+        """Test that queries return exactly the records in range across rotated segments."""
+        log = audit.AuditLog(tmp_path, segment_size=4096)
+        for i in range(1000):
+            log.write(make_record(1000.0 + i * 0.5, 'vhf pa-power on'))
+
+        assert len(log.segments()) > 1
+        records = list(log.query(1100.0, 1200.0))
+        assert records[0]['ts'] == 1100.0
+        assert records[-1]['ts'] == 1200.0
+        assert len(records) == 201
+
+    def test_query_seeks_with_index(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that records well before the range are not decoded."""
+        log = audit.AuditLog(tmp_path, segment_size=4096)
+        for i in range(1000):
+            log.write(make_record(1000.0 + i, 'uhf lna off'))
+
+        decoded = []
+        loads = json.loads
+
+        def counting_loads(line: bytes) -> object:
+            decoded.append(line)
+            return loads(line)
+
+        monkeypatch.setattr(audit.json, 'loads', counting_loads)
+        assert len(list(log.query(1900.0))) == 100
+        assert len(decoded) < 100 + 2 * audit.INDEX_INTERVAL
+
+    def test_query_skips_segments_ending_before_since(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that rotated segments ending before the range are not opened."""
+        log = audit.AuditLog(tmp_path, segment_size=4096)
+        for i in range(1000):
+            log.write(make_record(1000.0 + i, 'uhf lna off'))
+
+        opened = []
+        read_segment = audit._read_segment  # noqa: SLF001
+
+        def counting_read_segment(
+            path: Path, since: float, until: float
+        ) -> Iterator[dict[str, Any]]:
+            opened.append(path)
+            return read_segment(path, since, until)
+
+        monkeypatch.setattr(audit, '_read_segment', counting_read_segment)
+        assert len(list(log.query(1990.0))) == 10
+        assert len(log.segments()) > 10
+        assert len(opened) <= 2
+
+    def test_query_after_backward_clock_step(self, tmp_path: Path) -> None:
+        """Test that a backward clock step starts a new segment and loses no records."""
+        log = audit.AuditLog(tmp_path)
+        for ts in (1000.0, 1001.0, 1002.0, 500.0, 1000.5, 1001.5, 1003.0):
+            log.write(make_record(ts, 'vhf pa-power on'))
+
+        assert len(log.segments()) == 2
+        assert [r['ts'] for r in log.query(1000.0, 1002.0)] == [
+            1000.0,
+            1000.5,
+            1001.0,
+            1001.5,
+            1002.0,
+        ]
+        assert next(log.query())['ts'] == 500.0
+
+    def test_rotation_within_one_second(self, tmp_path: Path) -> None:
+        """Test that segments rotated within the same second are new files."""
+        log = audit.AuditLog(tmp_path, segment_size=1024)
+        for i in range(500):
+            log.write(make_record(1000.0 + i / 1000, 'vhf status'))
+
+        segments = log.segments()
+        assert len(segments) > 1
+        assert all(path.stat().st_size < 2048 for _, path in segments)
+        assert len(list(log.query())) == 500
+
+    def test_torn_record_is_skipped(self, tmp_path: Path) -> None:
+        """Test that a partial record from an interrupted write doesn't break queries."""
+        log = audit.AuditLog(tmp_path)
+        log.write(make_record(1.0, 'vhf status'))
+        segment = log.segments()[0][1]
+        with segment.open('a', encoding='utf-8') as f:
+            f.write('{"ts": 2.0, "tru')
+        log.write(make_record(3.0, 'uhf status'))
+
+        assert [r['ts'] for r in log.query()] == [1.0, 3.0]
+
+    def test_recovers_after_failed_append(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a transient write failure doesn't stop later records being written."""
+        log = audit.AuditLog(tmp_path)
+        append = audit._append  # noqa: SLF001
+
+        def failing_append(_path: Path, _data: bytes) -> int:
+            monkeypatch.setattr(audit, '_append', append)
+            raise OSError('No space left on device')
+
+        monkeypatch.setattr(audit, '_append', failing_append)
+        with pytest.raises(OSError, match='No space'):
+            log.write(make_record(1000.0, 'vhf status'))
+        log.write(make_record(1001.0, 'uhf status'))
+
+        assert [r['ts'] for r in log.query()] == [1001.0]
+
+    def test_recovers_after_segment_deleted(self, tmp_path: Path) -> None:
+        """Test that deleting the live segment starts a new one instead of failing."""
+        log = audit.AuditLog(tmp_path)
+        log.write(make_record(1000.0, 'vhf status'))
+        for _, path in log.segments():
+            path.unlink()
+        log.write(make_record(1000.5, 'uhf status'))
+
+        assert [r['ts'] for r in log.query(1000.2)] == [1000.5]
+
+    def test_unwritable_directory_still_replies(
+        self, tmp_path: Path, daemon: stationd.StationD
+    ) -> None:
+        """Test that a failing audit write doesn't stop the command being answered."""
+        (tmp_path / 'file').touch()
+        daemon.audit = audit.AuditLog(tmp_path / 'file' / 'audit')
+
+        sock = Mock()
+        daemon.command_handler(['foo'], sock, ('127.0.0.1', 5000))
+        assert sock.sendto.call_args.args[0] == b'FAIL: Invalid Command\n'
+
+    def test_main_filters(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test the query CLI device and outcome filters."""
+        log = audit.AuditLog(tmp_path)
+        log.write(make_record(1000.0, 'vhf pa-power on'))
+        log.write(make_record(1001.0, 'uhf pa-power on'))
+        log.write(make_record(1002.0, 'vhf rf-ptt on', 'PTTConflictError'))
+
+        audit.main(['--dir', str(tmp_path), '--device', 'vhf', '--outcome', 'ok', '--json'])
+        lines = capsys.readouterr().out.splitlines()
+        assert [json.loads(line)['command'] for line in lines] == [['vhf', 'pa-power', 'on']]
+
+    def test_main_missing_directory(self, tmp_path: Path) -> None:
+        """Test that the query CLI errors instead of printing nothing for a missing directory."""
+        with pytest.raises(SystemExit) as e:
+            audit.main(['--dir', str(tmp_path / 'missing')])
+        assert e.value.code == 2